@@ -11,9 +11,10 @@ from typing import TYPE_CHECKING, cast
 
 from ..domain.interfaces.device_config_reader_interface import DeviceConfig
 from ..domain.interfaces.heating_cycle_service_interface import IHeatingCycleService
+from ..domain.services.dead_time_calculation_service import DeadTimeCalculationService
 from ..domain.services.extraction_date_range_calculator import ExtractionDateRangeCalculator
 from ..domain.value_objects.heating import HeatingCycle
-from ..domain.value_objects.historical_data import HistoricalDataKey, HistoricalDataSet
+from ..domain.value_objects.historical_data import HistoricalDataSet
 from ..infrastructure.adapters.recording_extraction_queue import RecordingExtractionQueue
 
 if TYPE_CHECKING:
@@ -97,6 +98,8 @@ class HeatingCycleLifecycleManager:
         self._dead_time_updated_callback = dead_time_updated_callback
         self._extraction_semaphore = extraction_semaphore
         self._on_extraction_complete_callback = on_extraction_complete_callback
+        # Stateless calculator shared by every extraction run of this manager
+        self._dead_time_calculator = DeadTimeCalculationService()
 
         # In-memory cache for fast repeated lookups
         # Key: (device_id, target_date) → list[HeatingCycle]
@@ -428,10 +431,7 @@ class HeatingCycleLifecycleManager:
         )
         if cycles and self._lhs_storage is not None and self._device_config.auto_learning:
             try:
-                from ..domain.services import DeadTimeCalculationService
-
-                dead_time_calculator = DeadTimeCalculationService()
-                learned_dead_time = dead_time_calculator.calculate_average_dead_time(cycles)
+                learned_dead_time = self._dead_time_calculator.calculate_average_dead_time(cycles)
 
                 _LOGGER.debug(
                     "Calculated learned_dead_time: %s minutes",
@@ -1008,10 +1008,7 @@ class HeatingCycleLifecycleManager:
 
         if cycles and self._lhs_storage is not None and self._device_config.auto_learning:
             try:
-                from ..domain.services import DeadTimeCalculationService
-
-                dead_time_calculator = DeadTimeCalculationService()
-                learned_dead_time = dead_time_calculator.calculate_average_dead_time(cycles)
+                learned_dead_time = self._dead_time_calculator.calculate_average_dead_time(cycles)
 
                 _LOGGER.debug(
                     "Calculated learned_dead_time: %s minutes",
@@ -1206,33 +1203,25 @@ class HeatingCycleLifecycleManager:
 
         for adapter in self._historical_adapters:
             try:
-                # Call the interface method to fetch historical data for each data key
                 # Use the configured VTherm entity ID from device_config, not the device_id
                 vtherm_entity_id = self._device_config.vtherm_entity_id
                 _LOGGER.debug(
                     "Fetching historical data from adapter for entity_id=%s",
                     vtherm_entity_id,
                 )
-                for data_key in HistoricalDataKey:
-                    adapter_data = await adapter.fetch_historical_data(
-                        entity_id=vtherm_entity_id,
-                        data_key=data_key,
-                        start_time=start_time,
-                        end_time=end_time,
-                    )
-                    # Merge adapter data into combined_data
-                    if adapter_data is not None and adapter_data.data:
-                        # Only extend if this data_key exists in the adapter response
-                        if data_key in adapter_data.data:
+                # Fetch all supported data keys in a single recorder query
+                adapter_data = await adapter.fetch_all_historical_data(
+                    entity_id=vtherm_entity_id,
+                    start_time=start_time,
+                    end_time=end_time,
+                )
+                # Merge adapter data into combined_data
+                if adapter_data is not None and adapter_data.data:
+                    for data_key, measurements in adapter_data.data.items():
+                        if measurements:
                             if data_key not in combined_data.data:
                                 combined_data.data[data_key] = []
-                            combined_data.data[data_key].extend(adapter_data.data[data_key])
-                        else:
-                            _LOGGER.debug(
-                                "Data key %s not found in adapter response for entity %s",
-                                data_key.value,
-                                device_id,
-                            )
+                            combined_data.data[data_key].extend(measurements)
             except Exception as exc:
                 _LOGGER.error("Error loading data from adapter: %s", exc)
                 raise
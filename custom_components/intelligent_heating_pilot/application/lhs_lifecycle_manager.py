@@ -6,6 +6,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Callable
 
+from ..domain.constants import DEFAULT_LEARNED_SLOPE, MINIMUM_REALISTIC_LHS
 from ..domain.value_objects.heating import HeatingCycle
 
 if TYPE_CHECKING:
@@ -250,8 +251,6 @@ class LhsLifecycleManager:
         Returns:
             None.
         """
-        from ..domain.constants import DEFAULT_LEARNED_SLOPE, MINIMUM_REALISTIC_LHS
-
         _LOGGER.debug("Entering LhsLifecycleManager.on_retention_change")
         _LOGGER.debug("Recalculating LHS from %d cycles after retention change", len(cycles))
 
@@ -313,8 +312,6 @@ class LhsLifecycleManager:
         Returns:
             None.
         """
-        from ..domain.constants import DEFAULT_LEARNED_SLOPE, MINIMUM_REALISTIC_LHS
-
         _LOGGER.debug("Entering LhsLifecycleManager.on_24h_timer")
         _LOGGER.info("24h LHS refresh timer triggered")
 
@@ -367,8 +364,6 @@ class LhsLifecycleManager:
         Returns:
             The cached or default global LHS in C/hour.
         """
-        from ..domain.constants import DEFAULT_LEARNED_SLOPE
-
         _LOGGER.debug("Entering LhsLifecycleManager.get_global_lhs")
 
         # Check in-memory cache first (fast path)
@@ -493,8 +488,6 @@ class LhsLifecycleManager:
         )
 
         # If contextual LHS is None or invalid (< 0.5°C/h), fallback to global LHS
-        from ..domain.constants import MINIMUM_REALISTIC_LHS
-
         if computed_lhs is None or computed_lhs < MINIMUM_REALISTIC_LHS:
             _LOGGER.debug(
                 "Contextual LHS for hour %d is invalid (%.2f°C/h < %.2f°C/h), falling back to global LHS",
@@ -536,8 +529,6 @@ class LhsLifecycleManager:
         Returns:
             The computed and persisted global LHS in C/hour.
         """
-        from ..domain.constants import DEFAULT_LEARNED_SLOPE, MINIMUM_REALISTIC_LHS
-
         _LOGGER.debug("Entering LhsLifecycleManager.update_global_lhs_from_cycles")
         _LOGGER.debug("Updating global LHS from %d cycles", len(cycles))
 
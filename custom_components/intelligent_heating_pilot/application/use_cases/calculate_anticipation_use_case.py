@@ -12,6 +12,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from ...domain.constants import DEFAULT_LEARNED_SLOPE, MINIMUM_REALISTIC_LHS
+
 if TYPE_CHECKING:
     from datetime import datetime
 
@@ -92,9 +94,6 @@ class CalculateAnticipationUseCase:
             target_temp,
         )
 
-        # Import default constant for LHS validation
-        from ...domain.constants import DEFAULT_LEARNED_SLOPE, MINIMUM_REALISTIC_LHS
-
         # Determine target time and temp
         timeslot = None
         scheduler_entity = None
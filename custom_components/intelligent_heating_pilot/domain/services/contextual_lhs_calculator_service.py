@@ -89,28 +89,8 @@ class ContextualLHSCalculatorService:
         # Filter cycles starting at target hour
         matching_cycles = [c for c in cycles if self.extract_hour_from_cycle(c) == target_hour]
 
-        if not matching_cycles:
-            _LOGGER.debug("No cycles found for hour %d", target_hour)
-            return None
-
-        # Filter out non-positive slopes: cycles where temperature didn't rise
-        # carry no useful learning data about heating speed
-        lhs_values = [c.avg_heating_slope for c in matching_cycles if c.avg_heating_slope > 0]
-
-        if not lhs_values:
-            _LOGGER.debug("No cycles with positive heating slope for hour %d", target_hour)
-            return None
-
-        avg_lhs = sum(lhs_values) / len(lhs_values)
-
-        _LOGGER.info(
-            "Calculated contextual LHS for hour %d: %.2f°C/h from %d cycles",
-            target_hour,
-            avg_lhs,
-            len(matching_cycles),
-        )
-
-        return avg_lhs
+        slopes = [c.avg_heating_slope for c in matching_cycles]
+        return self._average_positive_slopes(target_hour, slopes)
 
     def calculate_all_contextual_lhs(self, cycles: list[HeatingCycle]) -> dict[int, float | None]:
         """Calculate contextual LHS for all 24 hours.
@@ -123,12 +103,54 @@ class ContextualLHSCalculatorService:
         """
         _LOGGER.info("Calculating contextual LHS for all 24 hours")
 
-        result = {}
-        for hour in range(24):
-            lhs = self.calculate_contextual_lhs_for_hour(cycles, hour)
-            result[hour] = lhs
+        # Single pass: project each cycle onto its (start hour, slope) pair once
+        # and bucket the slopes per hour, instead of rescanning every cycle for
+        # each of the 24 hours.
+        slopes_by_hour: list[list[float]] = [[] for _ in range(24)]
+        for cycle in cycles:
+            slopes_by_hour[cycle.start_time.hour].append(cycle.avg_heating_slope)
+
+        result: dict[int, float | None] = {
+            hour: self._average_positive_slopes(hour, slopes)
+            for hour, slopes in enumerate(slopes_by_hour)
+        }
 
         hours_with_data = sum(1 for v in result.values() if v is not None)
         _LOGGER.info("Contextual LHS calculated for %d hours with data", hours_with_data)
 
         return result
+
+    @staticmethod
+    def _average_positive_slopes(hour: int, slopes: list[float]) -> float | None:
+        """Average the positive slopes of the cycles starting at ``hour``.
+
+        Args:
+            hour: Hour (0-23) the slopes belong to, used for logging
+            slopes: Heating slopes of every cycle starting at that hour
+
+        Returns:
+            Average LHS value or None if no cycle starts at that hour or
+            no slope is positive
+        """
+        if not slopes:
+            _LOGGER.debug("No cycles found for hour %d", hour)
+            return None
+
+        # Filter out non-positive slopes: cycles where temperature didn't rise
+        # carry no useful learning data about heating speed
+        lhs_values = [slope for slope in slopes if slope > 0]
+
+        if not lhs_values:
+            _LOGGER.debug("No cycles with positive heating slope for hour %d", hour)
+            return None
+
+        avg_lhs = sum(lhs_values) / len(lhs_values)
+
+        _LOGGER.info(
+            "Calculated contextual LHS for hour %d: %.2f°C/h from %d cycles",
+            hour,
+            avg_lhs,
+            len(slopes),
+        )
+
+        return avg_lhs
@@ -48,7 +48,8 @@ class GlobalLHSCalculatorService:
 
         # Filter out non-positive slopes: cycles where temperature didn't rise
         # carry no useful learning data about heating speed
-        lhs_values = [cycle.avg_heating_slope for cycle in cycles if cycle.avg_heating_slope > 0]
+        # (single pass: each slope property is evaluated once per cycle)
+        lhs_values = [slope for cycle in cycles if (slope := cycle.avg_heating_slope) > 0]
 
         if not lhs_values:
             _LOGGER.info(
@@ -5,7 +5,9 @@ from __future__ import annotations
 import asyncio
 import bisect
 import logging
+from collections.abc import Mapping
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Any, cast
 
 from ..interfaces.heating_cycle_service_interface import IHeatingCycleService
@@ -18,6 +20,16 @@ from ..value_objects.historical_data import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared read-only stand-in for missing measurement attributes, so the per-measurement
+# checks below do not allocate a throwaway empty dict for every state
+_EMPTY_ATTRIBUTES: Mapping[str, Any] = MappingProxyType({})
+
+# State vocabularies checked once per measurement by the cycle state machine
+_ACTIVE_HVAC_ACTIONS = frozenset({"heating", "preheating"})
+_ACTIVE_FALLBACK_STATES = frozenset({"on", "heat", "heating", "true", "1"})
+_ENABLED_HVAC_MODES = frozenset({"heat", "heat_cool", "auto"})
+_ENABLED_FALLBACK_STATES = frozenset({"on", "true", "1"})
+
 
 class HeatingCycleService(IHeatingCycleService):
     """Service to detect and extract heating cycles from a raw historical dataset.
@@ -120,12 +132,16 @@ class HeatingCycleService(IHeatingCycleService):
 
         # Build sorted indexes once for O(log N) temperature lookups inside the loop.
         # Without this, _get_temperatures_at does an O(N) scan per measurement → O(N²) total.
-        indoor_hist, indoor_ts = self._build_sorted_history(
+        indoor_ts, indoor_values = self._build_sorted_history(
             history_data_set.data.get(HistoricalDataKey.INDOOR_TEMP, [])
         )
-        target_hist, target_ts = self._build_sorted_history(
+        target_ts, target_values = self._build_sorted_history(
             history_data_set.data.get(HistoricalDataKey.TARGET_TEMP, [])
         )
+        # Heating states are sorted too, so resolve their temperatures in one merge pass
+        state_times = [m.timestamp for m in heating_state_history]
+        indoor_at_states = self._sweep_floats_at(state_times, indoor_ts, indoor_values)
+        target_at_states = self._sweep_floats_at(state_times, target_ts, target_values)
 
         # Initialiser les variables de suivi de cycle
         heating_start: datetime | None = None
@@ -151,12 +167,8 @@ class HeatingCycleService(IHeatingCycleService):
                 await asyncio.sleep(0)
 
             timestamp = measurement.timestamp
-            # Separate concerns: mode_on (system enabled) vs action_active (actually heating)
-            mode_on = self._is_mode_on(measurement)
-            action_active = self._is_heating_active(measurement)
-
-            current_indoor_temp = self._lookup_float_at(indoor_hist, indoor_ts, timestamp)
-            current_target_temp = self._lookup_float_at(target_hist, target_ts, timestamp)
+            current_indoor_temp = indoor_at_states[i]
+            current_target_temp = target_at_states[i]
 
             measurements_processed += 1
 
@@ -173,6 +185,11 @@ class HeatingCycleService(IHeatingCycleService):
                     samples_logged += 1
                 continue
 
+            # Separate concerns: mode_on (system enabled) vs action_active (actually heating).
+            # Evaluated only for measurements the state machine will actually consume.
+            mode_on = self._is_mode_on(measurement)
+            action_active = self._is_heating_active(measurement)
+
             # Log first few measurements to understand the data
             if samples_logged < max_debug_samples:
                 _LOGGER.debug(
@@ -233,10 +250,9 @@ class HeatingCycleService(IHeatingCycleService):
                             self._safety_shutoff_grace_minutes,
                             end_ts,
                         )
-                        end_indoor = (
-                            self._lookup_float_at(indoor_hist, indoor_ts, end_ts)
-                            or current_indoor_temp
-                        )
+                        end_indoor = self._lookup_float_at(indoor_ts, indoor_values, end_ts)
+                        if end_indoor is None:
+                            end_indoor = current_indoor_temp
                         created = self._create_cycles(
                             device_id=device_id,
                             start_time=heating_start,
@@ -329,14 +345,18 @@ class HeatingCycleService(IHeatingCycleService):
                 device_id=device_id,
                 start_time=heating_start,
                 end_time=effective_end_time,
-                start_indoor_temp=cycle_start_indoor_temp or 20.0,
+                start_indoor_temp=cycle_start_indoor_temp
+                if cycle_start_indoor_temp is not None
+                else 20.0,
                 end_indoor_temp=self._get_value_at_time(
                     history_data_set.data.get(HistoricalDataKey.INDOOR_TEMP, []),
                     effective_end_time,
                     float,
-                )
-                or 20.0,
-                target_temp=cycle_start_target_temp or 20.0,
+                    default=20.0,
+                ),
+                target_temp=cycle_start_target_temp
+                if cycle_start_target_temp is not None
+                else 20.0,
                 history_data_set=history_data_set,
                 split_duration_minutes=split_duration,
             )
@@ -359,14 +379,14 @@ class HeatingCycleService(IHeatingCycleService):
         This logic abstracts whether the entity is a climate control, switch, or binary sensor.
         """
         # For action detection, prefer hvac_action attribute when present.
-        attrs = measurement.attributes or {}
+        attrs = measurement.attributes or _EMPTY_ATTRIBUTES
         hvac_action = attrs.get("hvac_action")
 
         if hvac_action:
             try:
                 action = hvac_action.lower() if isinstance(hvac_action, str) else None
 
-                if action in ("heating", "preheating"):
+                if action in _ACTIVE_HVAC_ACTIONS:
                     return True
             except Exception:
                 _LOGGER.debug("Error evaluating hvac_action: %s", attrs, exc_info=True)
@@ -374,7 +394,7 @@ class HeatingCycleService(IHeatingCycleService):
         # Fallback: non-climate entities (binary sensor, switch) or missing attrs
         if isinstance(measurement.value, str):
             state = measurement.value.lower()
-            return state in ("on", "heat", "heating", "true", "1")
+            return state in _ACTIVE_FALLBACK_STATES
         return bool(measurement.value)
 
     def _is_mode_on(self, measurement: HistoricalMeasurement) -> bool:
@@ -383,20 +403,20 @@ class HeatingCycleService(IHeatingCycleService):
         This checks `hvac_mode` against Home Assistant's heating-related modes.
         Falls back to truthiness of the measurement value when attributes are missing.
         """
-        attrs = measurement.attributes or {}
+        attrs = measurement.attributes or _EMPTY_ATTRIBUTES
         hvac_mode = attrs.get("hvac_mode")
 
         if hvac_mode:
             try:
                 mode = hvac_mode.lower() if isinstance(hvac_mode, str) else None
-                return mode in ("heat", "heat_cool", "auto")
+                return mode in _ENABLED_HVAC_MODES
             except Exception:
                 _LOGGER.debug("Error evaluating hvac_mode: %s", attrs, exc_info=True)
 
         # Fallback for non-climate entities
         if isinstance(measurement.value, str):
             state = measurement.value.lower()
-            return state in ("on", "true", "1")
+            return state in _ENABLED_FALLBACK_STATES
         return bool(measurement.value)
 
     def _get_value_at_time(
@@ -405,6 +425,7 @@ class HeatingCycleService(IHeatingCycleService):
         target_time: datetime,
         value_type: type,
         attribute_name: str | None = None,
+        default: Any | None = None,
     ) -> Any | None:
         """Get the sensor value at or before a specific time from a list of HistoricalMeasurement.
 
@@ -413,9 +434,10 @@ class HeatingCycleService(IHeatingCycleService):
             target_time: Time to find the value for.
             value_type: The expected type of the value (e.g., float, str).
             attribute_name: If provided, extract value from attributes (e.g., 'current_temperature').
+            default: Value returned when no valid measurement is found.
 
         Returns:
-            The sensor value cast to value_type, or None if not found/invalid.
+            The sensor value cast to value_type, or default if not found/invalid.
         """
         closest_measurement: HistoricalMeasurement | None = None
 
@@ -444,7 +466,7 @@ class HeatingCycleService(IHeatingCycleService):
                     value_type.__name__,
                     closest_measurement.timestamp,
                 )
-        return None
+        return default
 
     def _create_cycles(
         self,
@@ -722,7 +744,7 @@ class HeatingCycleService(IHeatingCycleService):
             return 0.0, []
 
         t_samples = sorted(tariff_history, key=lambda m: m.timestamp)
-        start_price = self._get_value_at_time(t_samples, start_time, float) or 0.0
+        start_price = self._get_value_at_time(t_samples, start_time, float, default=0.0)
 
         # Build segment boundaries at tariff price changes
         boundaries: list[datetime] = [start_time]
@@ -745,14 +767,21 @@ class HeatingCycleService(IHeatingCycleService):
         total_segment_energy = 0.0
         tariff_details: list[TariffPeriodDetail] = []
 
-        for a, b in zip(boundaries[:-1], boundaries[1:]):
+        # Cumulative meter reading at each boundary, resolved once (missing -> 0.0):
+        # consecutive segments share a boundary, so each reading is used twice
+        boundary_energies = [
+            self._get_value_at_time(energy_history, boundary, float, default=0.0)
+            for boundary in boundaries
+        ]
+
+        for a, b, start_energy, end_energy in zip(
+            boundaries[:-1], boundaries[1:], boundary_energies[:-1], boundary_energies[1:]
+        ):
             # Energy consumed in segment (from cumulative meter)
-            start_energy = self._get_value_at_time(energy_history, a, float) or 0.0
-            end_energy = self._get_value_at_time(energy_history, b, float) or 0.0
             energy_segment = max(0.0, end_energy - start_energy)
 
             # Price applicable at segment start
-            price = self._get_value_at_time(t_samples, a, float) or 0.0
+            price = self._get_value_at_time(t_samples, a, float, default=0.0)
             cost_segment = energy_segment * price
 
             # Runtime in segment: sum on_time_sec values within [a, b] or use temporal duration
@@ -919,35 +948,43 @@ class HeatingCycleService(IHeatingCycleService):
     @staticmethod
     def _build_sorted_history(
         history: list[HistoricalMeasurement],
-    ) -> tuple[list[HistoricalMeasurement], list[datetime]]:
-        """Sort a measurement list by timestamp and return a parallel timestamp list for bisect.
+    ) -> tuple[list[datetime], list[float | None]]:
+        """Sort a measurement list by timestamp into parallel timestamp and value lists.
 
-        Pre-building the sorted list and its timestamp index once before a lookup loop
-        reduces temperature lookups from O(N) per call to O(log N) via bisect.
+        Pre-building the sorted timestamp index once before a lookup loop reduces
+        temperature lookups from O(N) per call to O(log N) via bisect. Values are
+        converted to float here, once per measurement, rather than on every lookup.
 
         Args:
             history: Unsorted list of historical measurements.
 
         Returns:
-            Tuple of (sorted_measurements, sorted_timestamps).
+            Tuple of (sorted_timestamps, float_values); a value is None when the
+            measurement cannot be converted to float.
         """
         sorted_hist = sorted(history, key=lambda m: m.timestamp)
-        return sorted_hist, [m.timestamp for m in sorted_hist]
+        values: list[float | None] = []
+        for measurement in sorted_hist:
+            try:
+                values.append(float(measurement.value))
+            except (ValueError, TypeError):
+                values.append(None)
+        return [m.timestamp for m in sorted_hist], values
 
     @staticmethod
     def _lookup_float_at(
-        sorted_history: list[HistoricalMeasurement],
         sorted_timestamps: list[datetime],
+        values: list[float | None],
         target_time: datetime,
     ) -> float | None:
         """Return the float value of the latest measurement at or before target_time.
 
         Uses binary search (O(log N)) on a pre-sorted index. Requires the parallel
-        sorted_timestamps list built by _build_sorted_history.
+        lists built by _build_sorted_history.
 
         Args:
-            sorted_history: Measurements sorted ascending by timestamp.
-            sorted_timestamps: Parallel list of timestamps for bisect.
+            sorted_timestamps: Timestamps sorted ascending, for bisect.
+            values: Parallel list of float values (None when not convertible).
             target_time: The time to look up.
 
         Returns:
@@ -956,10 +993,35 @@ class HeatingCycleService(IHeatingCycleService):
         idx = bisect.bisect_right(sorted_timestamps, target_time) - 1
         if idx < 0:
             return None
-        try:
-            return float(sorted_history[idx].value)
-        except (ValueError, TypeError):
-            return None
+        return values[idx]
+
+    @staticmethod
+    def _sweep_floats_at(
+        query_times: list[datetime],
+        sorted_timestamps: list[datetime],
+        values: list[float | None],
+    ) -> list[float | None]:
+        """Return the latest value at or before each of a sorted list of query times.
+
+        Equivalent to calling _lookup_float_at for every query time, but walks both
+        sorted lists once with two pointers: O(N + M) instead of O(N log M).
+
+        Args:
+            query_times: Times to look up, sorted ascending.
+            sorted_timestamps: Timestamps sorted ascending, as built by _build_sorted_history.
+            values: Parallel list of float values (None when not convertible).
+
+        Returns:
+            List parallel to query_times with the value found for each, or None.
+        """
+        results: list[float | None] = []
+        idx = -1
+        last_idx = len(sorted_timestamps) - 1
+        for query_time in query_times:
+            while idx < last_idx and sorted_timestamps[idx + 1] <= query_time:
+                idx += 1
+            results.append(values[idx] if idx >= 0 else None)
+        return results
 
     def _should_start_cycle(
         self,
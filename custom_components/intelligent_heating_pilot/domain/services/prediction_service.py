@@ -40,6 +40,9 @@ class PredictionService:
     5. Learned heating slope (heating rate) from historical data
     """
 
+    # Stateless: one instance per device, no per-instance __dict__ needed
+    __slots__ = ()
+
     def predict_heating_time(
         self,
         current_temp: float | None,
@@ -109,19 +112,29 @@ class PredictionService:
 
         # Calculate base anticipation time (in minutes)
         # Formula: heating_time = dead_time + (temp_delta / slope) * 60
-        anticipation_minutes = dead_time_minutes + (temp_delta / learned_slope) * 60.0
-        # Apply environmental correction factors
-        correction_factor = self._calculate_environmental_correction(
-            outdoor_temp, humidity, cloud_coverage
-        )
-
-        anticipation_minutes *= correction_factor
+        # The slope inverse is taken once so the rest of the computation stays in
+        # plain float multiplications; the timedelta is only built at the very end.
+        minutes_per_degree = 60.0 / learned_slope
+        anticipation_minutes = dead_time_minutes + temp_delta * minutes_per_degree
+
+        # Apply environmental correction factors (skipped when no sensor is available,
+        # since the neutral factor is exactly 1.0)
+        if outdoor_temp is None and humidity is None and cloud_coverage is None:
+            correction_factor = 1.0
+        else:
+            correction_factor = self._calculate_environmental_correction(
+                outdoor_temp, humidity, cloud_coverage
+            )
+            anticipation_minutes *= correction_factor
 
         # Apply buffer and limits
         anticipation_minutes += DEFAULT_ANTICIPATION_BUFFER
-        anticipation_minutes = max(
-            MIN_ANTICIPATION_TIME, min(MAX_ANTICIPATION_TIME, anticipation_minutes)
-        )
+        # Plain comparisons instead of nested max()/min() builtin calls: the
+        # value is within limits in the common case, so neither branch is taken.
+        if anticipation_minutes < MIN_ANTICIPATION_TIME:
+            anticipation_minutes = MIN_ANTICIPATION_TIME
+        elif anticipation_minutes > MAX_ANTICIPATION_TIME:
+            anticipation_minutes = MAX_ANTICIPATION_TIME
 
         # Calculate anticipated start time
         anticipated_start = target_time - timedelta(minutes=anticipation_minutes)
@@ -235,11 +248,7 @@ class PredictionService:
             confidence = BASE_LOW_CONFIDENCE
 
         # Adjust confidence based on available environmental data
-        data_availability = 0
-        if outdoor_temp is not None:
-            data_availability += 1
-        if humidity is not None:
-            data_availability += 1
+        data_availability = sum(x is not None for x in (outdoor_temp, humidity))
 
         # Increase confidence slightly with more environmental data
         confidence += data_availability * CONFIDENCE_BOOST_PER_SENSOR
@@ -33,7 +33,7 @@ class AttributeConcept(Enum):
     CLOUD_COVERAGE = "cloud_coverage"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AttributePath:
     """Describes where to find a value in an entity's attributes.
 
@@ -50,7 +50,7 @@ class AttributePath:
     required: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntityAttributeMapping:
     """Maps domain concepts to actual entity attributes.
 
@@ -97,7 +97,7 @@ class EntityAttributeMapping:
         return bool(self.get_attribute_paths(concept))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntityAttributeDescriptor:
     """Describes the attribute structure of an entity instance.
 
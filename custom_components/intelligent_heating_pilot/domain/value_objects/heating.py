@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 
@@ -16,7 +16,7 @@ class HeatingAction(Enum):
     NO_ACTION = "no_action"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HeatingDecision:
     """Represents a decision about heating control.
 
@@ -41,7 +41,7 @@ class HeatingDecision:
             raise ValueError("SET_TEMPERATURE action requires a target temperature")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TariffPeriodDetail:
     """Represents energy consumption and cost details for a specific tariff period."""
 
@@ -51,7 +51,7 @@ class TariffPeriodDetail:
     cost_euro: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HeatingCycle:
     """Represents a single heating cycle, encapsulating all its relevant data.
 
@@ -86,10 +86,12 @@ class HeatingCycle:
     tariff_details: list[TariffPeriodDetail] | None = None
     dead_time_cycle_minutes: float | None = None
     min_effective_duration_minutes: float = 5.0
+    # Computed once in __post_init__ (the cycle is immutable); read via avg_heating_slope
+    _avg_heating_slope: float = field(init=False, repr=False, compare=False)
 
     @property
     def avg_heating_slope(self) -> float:
-        """Calculates the average heating slope in °C/hour for the heating cycle.
+        """Average heating slope in °C/hour for the heating cycle.
 
         Excludes the dead_time_cycle period to get the true heating slope once
         the system is actively heating (without initial inertia).
@@ -98,7 +100,14 @@ class HeatingCycle:
         than ``min_effective_duration_minutes``. This guards against aberrant slope values that
         arise when dead_time ≈ total_duration, leaving an effective duration of only a few
         microseconds and producing slopes in the range of 100 000–200 000 °C/h.
+
+        The value is computed once at construction, as LHS calculations read it
+        several times per cycle.
         """
+        return self._avg_heating_slope
+
+    def _compute_avg_heating_slope(self) -> float:
+        """Compute the value exposed by ``avg_heating_slope``."""
         # Calculate effective start time (after dead_time_cycle)
         if self.dead_time_cycle_minutes and self.dead_time_cycle_minutes > 0:
             effective_start_time = self.start_time + timedelta(minutes=self.dead_time_cycle_minutes)
@@ -164,6 +173,7 @@ class HeatingCycle:
         return sum(detail.cost_euro for detail in (self.tariff_details or []))
 
     def __post_init__(self) -> None:
-        """Validate the heating cycle data."""
+        """Validate the heating cycle data and precompute its average slope."""
         if self.start_time >= self.end_time:
             raise ValueError("Start time must be before end time for a heating cycle.")
+        object.__setattr__(self, "_avg_heating_slope", self._compute_avg_heating_slope())
@@ -8,12 +8,12 @@ cycle extraction without re-scanning entire recorder history.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 
 from .heating import HeatingCycle
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HeatingCycleCacheData:
     """Immutable record of cached heating cycles with metadata.
 
@@ -75,8 +75,6 @@ class HeatingCycleCacheData:
         Returns:
             List of cycles within retention period
         """
-        from datetime import timedelta
-
         cutoff_time = reference_time - timedelta(days=self.retention_days)
         return [cycle for cycle in self.cycles if cycle.start_time >= cutoff_time]
 
@@ -27,7 +27,7 @@ class HistoricalDataKey(Enum):
     # Ajoutez d'autres clés au besoin
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HistoricalMeasurement:
     """Represents a single historical measurement for an entity at a specific timestamp.
 
@@ -44,7 +44,7 @@ class HistoricalMeasurement:
     entity_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HistoricalDataSet:
     """A collection of historical measurements, categorized by a HistoricalDataKey.
 
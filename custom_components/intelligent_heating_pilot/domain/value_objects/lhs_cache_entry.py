@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LHSCacheEntry:
     """Represents a cached LHS value and its metadata."""
 
@@ -17,7 +17,7 @@ class ExtractionTaskState(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RecordingExtractionTask:
     """Represents a period extraction task from the Home Assistant Recorder.
 
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import logging
 from abc import abstractmethod
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 from ...domain.interfaces.entity_attribute_mapper_interface import IEntityAttributeMapper
@@ -22,6 +23,16 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+@cache
+def _split_attribute_path(path: str) -> tuple[str, ...]:
+    """Split a dot-separated attribute path into its keys.
+
+    Memoized: paths come from the static mappings, so the set is small and
+    each one is split once instead of for every history record.
+    """
+    return tuple(path.split("."))
+
+
 class BaseEntityAttributeMapper(IEntityAttributeMapper):
     """Base implementation for entity attribute mappers.
 
@@ -38,6 +49,7 @@ class BaseEntityAttributeMapper(IEntityAttributeMapper):
             hass: Home Assistant instance
         """
         self._hass = hass
+        self._mapping: EntityAttributeMapping | None = None
 
     @abstractmethod
     def _get_mapping(self) -> EntityAttributeMapping:
@@ -50,13 +62,26 @@ class BaseEntityAttributeMapper(IEntityAttributeMapper):
         """
         pass
 
+    def _get_cached_mapping(self) -> EntityAttributeMapping:
+        """Get the attribute mapping, building it only on first use.
+
+        Mappings are static per mapper type, while extract_attribute_value()
+        runs for every history record and concept.
+
+        Returns:
+            EntityAttributeMapping with entity-specific attribute paths
+        """
+        if self._mapping is None:
+            self._mapping = self._get_mapping()
+        return self._mapping
+
     def get_supported_concepts(self) -> list[AttributeConcept]:
         """Get list of domain concepts this mapper can extract.
 
         Returns:
             List of AttributeConcept values supported by this mapper
         """
-        mapping = self._get_mapping()
+        mapping = self._get_cached_mapping()
         return list(mapping.mappings.keys())
 
     def detect_entity_type(
@@ -95,7 +120,7 @@ class BaseEntityAttributeMapper(IEntityAttributeMapper):
             detected_attributes,
         )
 
-        mapping = self._get_mapping()
+        mapping = self._get_cached_mapping()
         return EntityAttributeDescriptor(
             entity_id=entity_id,
             entity_type=mapping.entity_type,
@@ -123,7 +148,7 @@ class BaseEntityAttributeMapper(IEntityAttributeMapper):
         Raises:
             ValueError: If concept not supported by this mapper
         """
-        mapping = self._get_mapping()
+        mapping = self._get_cached_mapping()
         paths = mapping.get_attribute_paths(concept)
 
         if not paths:
@@ -178,7 +203,7 @@ class BaseEntityAttributeMapper(IEntityAttributeMapper):
             Value at the path or None if not found
         """
         current: Any = attributes
-        for key in path.split("."):
+        for key in _split_attribute_path(path):
             if isinstance(current, dict):
                 current = current.get(key)
                 if current is None:
@@ -22,6 +22,9 @@ _LOGGER = logging.getLogger(__name__)
 # Storage version
 STORAGE_VERSION = 1
 
+# Delay (seconds) used to coalesce bursts of writes into a single disk save
+SAVE_DELAY_SECONDS = 5
+
 # Type variable for generic data structure
 TData = TypeVar("TData")
 
@@ -111,6 +114,16 @@ class BaseHAStorageAdapter(ABC, Generic[TData]):
         await self._store.async_save(self._data)
         _LOGGER.debug("Saved storage data for %s", self.__class__.__name__)
 
+    def _schedule_save(self) -> None:
+        """Schedule a delayed save of the current data.
+
+        Repeated calls within SAVE_DELAY_SECONDS coalesce into one write.
+        Home Assistant flushes pending delayed saves on shutdown, and a later
+        _save_data() call supersedes any pending one.
+        """
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY_SECONDS)
+        _LOGGER.debug("Scheduled storage save for %s", self.__class__.__name__)
+
     def _parse_datetime(self, dt_string: str) -> datetime:
         """Parse an ISO datetime string to a timezone-aware datetime object.
 
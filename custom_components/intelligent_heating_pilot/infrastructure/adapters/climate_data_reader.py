@@ -10,6 +10,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from ...domain.interfaces.climate_data_reader_interface import IClimateDataReader
@@ -22,6 +23,7 @@ from ...domain.value_objects import (
 from ...domain.value_objects.entity_attribute_mapping import AttributeConcept
 from ..vtherm_compat import get_vtherm_attribute
 from .entity_attribute_mapper_registry import EntityAttributeMapperRegistry
+from .utils import safe_float
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -41,6 +43,17 @@ DATA_KEY_TO_CONCEPT: dict[HistoricalDataKey, AttributeConcept] = {
     HistoricalDataKey.CLOUD_COVERAGE: AttributeConcept.CLOUD_COVERAGE,
 }
 
+# Concepts whose extracted values must be numeric
+_FLOAT_CONCEPTS: frozenset[AttributeConcept] = frozenset(
+    {
+        AttributeConcept.CURRENT_TEMPERATURE,
+        AttributeConcept.TARGET_TEMPERATURE,
+    }
+)
+
+# Keys needed by domain services (heating_cycle_service uses these)
+_ESSENTIAL_ATTR_KEYS: tuple[str, ...] = ("hvac_action", "hvac_mode")
+
 
 class HAClimateDataReader(IClimateDataReader, IHistoricalDataAdapter):
     """Unified adapter for VTherm climate data (real-time + historical).
@@ -247,11 +260,8 @@ class HAClimateDataReader(IClimateDataReader, IHistoricalDataAdapter):
             # Add measurement if value was extracted
             if value is not None:
                 # For float concepts, ensure we have a numeric value
-                if concept in [
-                    AttributeConcept.CURRENT_TEMPERATURE,
-                    AttributeConcept.TARGET_TEMPERATURE,
-                ]:
-                    value = self._safe_float(value)
+                if concept in _FLOAT_CONCEPTS:
+                    value = safe_float(value)
                     if value is None:
                         continue
 
@@ -337,40 +347,42 @@ class HAClimateDataReader(IClimateDataReader, IHistoricalDataAdapter):
         supported_concepts = mapper.get_supported_concepts()
         data: dict[HistoricalDataKey, list[HistoricalMeasurement]] = {}
 
-        # Keys needed by domain services (heating_cycle_service uses these)
-        _ESSENTIAL_ATTR_KEYS = {"hvac_action", "hvac_mode"}
+        # Read each record's fields once; every data key below reuses them
+        timestamps = [self._parse_timestamp(record) for record in historical_records]
+        record_attributes = [record.get("attributes", {}) for record in historical_records]
+        record_entity_ids = [record.get("entity_id", entity_id) for record in historical_records]
+        # Only keep essential attributes to avoid holding the full HA State
+        # attribute blob in memory (OOM prevention); one dict per record.
+        record_slim_attributes = [
+            {k: attributes[k] for k in _ESSENTIAL_ATTR_KEYS if k in attributes}
+            for attributes in record_attributes
+        ]
 
         # Extract all supported data keys from the single set of records
         for data_key, concept in DATA_KEY_TO_CONCEPT.items():
             if concept not in supported_concepts:
                 continue
 
+            is_float_concept = concept in _FLOAT_CONCEPTS
             measurements: list[HistoricalMeasurement] = []
-            for record in historical_records:
-                timestamp = self._parse_timestamp(record)
-                full_attributes = record.get("attributes", {})
-                entity_id_from_record = record.get("entity_id", entity_id)
-
+            for timestamp, full_attributes, entity_id_from_record, slim_attributes in zip(
+                timestamps,
+                record_attributes,
+                record_entity_ids,
+                record_slim_attributes,
+                strict=True,
+            ):
                 try:
                     value = mapper.extract_attribute_value(full_attributes, concept)
                 except ValueError:
                     value = None
 
                 if value is not None:
-                    if concept in [
-                        AttributeConcept.CURRENT_TEMPERATURE,
-                        AttributeConcept.TARGET_TEMPERATURE,
-                    ]:
-                        value = self._safe_float(value)
+                    if is_float_concept:
+                        value = safe_float(value)
                         if value is None:
                             continue
 
-                    # Only keep essential attributes to avoid holding the full
-                    # HA State attribute blob in memory (OOM prevention).
-                    slim_attributes = {
-                        k: full_attributes[k] for k in _ESSENTIAL_ATTR_KEYS if k in full_attributes
-                    }
-
                     measurements.append(
                         HistoricalMeasurement(
                             timestamp=timestamp,
@@ -384,7 +396,7 @@ class HAClimateDataReader(IClimateDataReader, IHistoricalDataAdapter):
                 data[data_key] = measurements
 
         # Release the raw recorder data now that extraction is complete
-        del historical_records
+        del historical_records, record_attributes
 
         total = sum(len(v) for v in data.values())
         _LOGGER.debug(
@@ -431,21 +443,6 @@ class HAClimateDataReader(IClimateDataReader, IHistoricalDataAdapter):
         # Fallback: return current time if no timestamp found
         return datetime.now()
 
-    @staticmethod
-    def _safe_float(value: Any) -> float | None:
-        """Safely convert value to float.
-
-        Args:
-            value: Value to convert
-
-        Returns:
-            Float value or None if conversion fails
-        """
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return None
-
     async def _fetch_history(
         self,
         entity_id: str,
@@ -470,8 +467,6 @@ class HAClimateDataReader(IClimateDataReader, IHistoricalDataAdapter):
         Returns:
             List of historical records from Home Assistant
         """
-        from functools import partial
-
         from homeassistant.components.recorder import get_instance, history
 
         # Use Home Assistant's get_significant_states function from recorder
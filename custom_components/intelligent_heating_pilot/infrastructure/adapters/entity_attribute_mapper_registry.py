@@ -10,6 +10,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from ...domain.interfaces.entity_attribute_mapper_interface import IEntityAttributeMapper
+from ...domain.value_objects.entity_attribute_mapping import AttributeConcept
 from .generic_climate_attribute_mapper import GenericClimateAttributeMapper
 from .vtherm_attribute_mapper import VThermAttributeMapper
 
@@ -114,8 +115,6 @@ class EntityAttributeMapperRegistry:
                 )
 
                 # Check if mapper has required attributes for basic operation
-                from ...domain.value_objects.entity_attribute_mapping import AttributeConcept
-
                 basic_concepts = [
                     AttributeConcept.CURRENT_TEMPERATURE,
                     AttributeConcept.TARGET_TEMPERATURE,
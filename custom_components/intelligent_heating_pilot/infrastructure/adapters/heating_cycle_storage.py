@@ -7,6 +7,7 @@ to persist heating cycles with incremental update support.
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
@@ -56,6 +57,8 @@ class HAHeatingCycleStorage(BaseHAStorageAdapter[dict[str, Any]], IHeatingCycleS
             storage_key=STORAGE_KEY,
             retention_days=retention_days,
         )
+        # Deserialized cache per device; dropped whenever that device's data is written
+        self._cache_data_by_device: dict[str, HeatingCycleCacheData] = {}
 
         _LOGGER.debug(
             "Initializing HAHeatingCycleStorage with entry_id=%s, retention_days=%s",
@@ -85,6 +88,11 @@ class HAHeatingCycleStorage(BaseHAStorageAdapter[dict[str, Any]], IHeatingCycleS
 
         await self._ensure_loaded()
 
+        cached = self._cache_data_by_device.get(device_id)
+        if cached is not None:
+            _LOGGER.debug("Exiting HAHeatingCycleStorage.get_cache_data")
+            return cached
+
         device_data = self._data.get(device_id)
         if not device_data:
             _LOGGER.debug("No cache found for device_id=%s", device_id)
@@ -125,6 +133,7 @@ class HAHeatingCycleStorage(BaseHAStorageAdapter[dict[str, Any]], IHeatingCycleS
             retention_days=retention_days,
             explored_dates=frozenset(explored_dates),
         )
+        self._cache_data_by_device[device_id] = cache_data
 
         _LOGGER.debug(
             "Retrieved cache with %d cycles, last_search_time=%s",
@@ -164,7 +173,8 @@ class HAHeatingCycleStorage(BaseHAStorageAdapter[dict[str, Any]], IHeatingCycleS
         # Get existing cache or initialize
         existing_cache = await self.get_cache_data(device_id)
 
-        existing_cycles = list(existing_cache.cycles) if existing_cache else []
+        # Read-only alias: the merged list below is the only copy that gets built
+        existing_cycles = existing_cache.cycles if existing_cache else ()
         existing_explored_dates = set(existing_cache.explored_dates) if existing_cache else set()
 
         # Deduplicate: Use (start_time, device_id) as key
@@ -177,9 +187,13 @@ class HAHeatingCycleStorage(BaseHAStorageAdapter[dict[str, Any]], IHeatingCycleS
             if (cycle.start_time, cycle.device_id) not in existing_keys
         ]
 
-        # Combine and sort by start_time
-        all_cycles = existing_cycles + unique_new_cycles
-        all_cycles.sort(key=lambda c: c.start_time)
+        # Pair each cycle with its serialized dict (only new cycles get serialized)
+        # and combine, sorted by start_time
+        all_entries = self._pair_with_stored_dicts(device_id, existing_cycles) + [
+            (cycle, self._serialize_heating_cycle(cycle)) for cycle in unique_new_cycles
+        ]
+        all_entries.sort(key=lambda entry: entry[0].start_time)
+        all_cycles = [cycle for cycle, _ in all_entries]
 
         # Use provided retention_days or fall back to instance default
         stored_retention_days = (
@@ -190,8 +204,9 @@ class HAHeatingCycleStorage(BaseHAStorageAdapter[dict[str, Any]], IHeatingCycleS
         explored_dates_serialized = [d.isoformat() for d in existing_explored_dates]
 
         # Update storage
+        self._cache_data_by_device.pop(device_id, None)
         self._data[device_id] = {
-            "cycles": self._serialize_heating_cycles(all_cycles),
+            "cycles": [cycle_dict for _, cycle_dict in all_entries],
             "last_search_time": self._serialize_datetime(search_end_time),
             "retention_days": stored_retention_days,
             "explored_dates": explored_dates_serialized,
@@ -237,6 +252,7 @@ class HAHeatingCycleStorage(BaseHAStorageAdapter[dict[str, Any]], IHeatingCycleS
                 device_id,
             )
             explored_dates_serialized = [d.isoformat() for d in explored_dates]
+            self._cache_data_by_device.pop(device_id, None)
             self._data[device_id] = {
                 "cycles": [],
                 "last_search_time": self._serialize_datetime(datetime.utcnow()),
@@ -257,8 +273,12 @@ class HAHeatingCycleStorage(BaseHAStorageAdapter[dict[str, Any]], IHeatingCycleS
         explored_dates_serialized = [d.isoformat() for d in merged_explored_dates]
 
         # Update storage (keep existing cycles and last_search_time)
+        self._cache_data_by_device.pop(device_id, None)
         self._data[device_id] = {
-            "cycles": self._serialize_heating_cycles(list(cache_data.cycles)),
+            "cycles": [
+                cycle_dict
+                for _, cycle_dict in self._pair_with_stored_dicts(device_id, cache_data.cycles)
+            ],
             "last_search_time": self._serialize_datetime(cache_data.last_search_time),
             "retention_days": cache_data.retention_days,
             "explored_dates": explored_dates_serialized,
@@ -304,10 +324,14 @@ class HAHeatingCycleStorage(BaseHAStorageAdapter[dict[str, Any]], IHeatingCycleS
 
         cutoff_time = reference_time - timedelta(days=cache_data.retention_days)
 
-        # Filter cycles within retention
-        retained_cycles = [cycle for cycle in cache_data.cycles if cycle.start_time >= cutoff_time]
+        # Filter cycles within retention, keeping their already-serialized dicts
+        retained_entries = [
+            (cycle, cycle_dict)
+            for cycle, cycle_dict in self._pair_with_stored_dicts(device_id, cache_data.cycles)
+            if cycle.start_time >= cutoff_time
+        ]
 
-        removed_count = len(cache_data.cycles) - len(retained_cycles)
+        removed_count = len(cache_data.cycles) - len(retained_entries)
 
         if removed_count > 0:
             # Also prune explored_dates that are older than retention
@@ -316,20 +340,23 @@ class HAHeatingCycleStorage(BaseHAStorageAdapter[dict[str, Any]], IHeatingCycleS
             explored_dates_serialized = [d.isoformat() for d in retained_explored_dates]
 
             # Update storage
+            self._cache_data_by_device.pop(device_id, None)
             self._data[device_id] = {
-                "cycles": self._serialize_heating_cycles(list(retained_cycles)),
+                "cycles": [cycle_dict for _, cycle_dict in retained_entries],
                 "last_search_time": self._serialize_datetime(cache_data.last_search_time),
                 "retention_days": cache_data.retention_days,
                 "explored_dates": explored_dates_serialized,
             }
 
-            await self._save_data()
+            # Pruning only drops data, so persisting it can wait: the append that
+            # usually follows (or Home Assistant's shutdown flush) writes it out
+            self._schedule_save()
 
             _LOGGER.debug(
                 "Pruned %d cycles older than %s (retained %d)",
                 removed_count,
                 cutoff_time,
-                len(retained_cycles),
+                len(retained_entries),
             )
             _LOGGER.debug("Exiting HAHeatingCycleStorage.prune_old_cycles")
             return True
@@ -349,6 +376,7 @@ class HAHeatingCycleStorage(BaseHAStorageAdapter[dict[str, Any]], IHeatingCycleS
 
         await self._ensure_loaded()
 
+        self._cache_data_by_device.pop(device_id, None)
         if device_id in self._data:
             del self._data[device_id]
             await self._save_data()
@@ -400,16 +428,27 @@ class HAHeatingCycleStorage(BaseHAStorageAdapter[dict[str, Any]], IHeatingCycleS
 
         return result
 
-    def _serialize_heating_cycles(self, cycles: list[HeatingCycle]) -> list[dict[str, Any]]:
-        """Serialize HeatingCycle objects to JSON-compatible dicts.
+    def _pair_with_stored_dicts(
+        self,
+        device_id: str,
+        cycles: Sequence[HeatingCycle],
+    ) -> list[tuple[HeatingCycle, dict[str, Any]]]:
+        """Pair cached cycles with their serialized dicts.
+
+        Reuses the dicts already held in storage when every stored entry was
+        deserialized (same count, same order), and serializes the cycles otherwise.
 
         Args:
-            cycles: List of HeatingCycle objects
+            device_id: The device identifier
+            cycles: Cycles deserialized from this device's stored data
 
         Returns:
-            List of serialized cycle dictionaries
+            List of (cycle, serialized cycle dict) pairs in the order of cycles
         """
-        return [self._serialize_heating_cycle(cycle) for cycle in cycles]
+        stored_cycle_dicts = self._data.get(device_id, {}).get("cycles", [])
+        if cycles and len(stored_cycle_dicts) == len(cycles):
+            return list(zip(cycles, stored_cycle_dicts, strict=True))
+        return [(cycle, self._serialize_heating_cycle(cycle)) for cycle in cycles]
 
     def _serialize_heating_cycle(self, cycle: HeatingCycle) -> dict[str, Any]:
         """Serialize a single HeatingCycle to a JSON-compatible dict.
@@ -11,10 +11,12 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 
+from ...domain.constants import MINIMUM_REALISTIC_LHS
 from ...domain.interfaces import ILhsStorage
 from ...domain.value_objects.lhs_cache_entry import LHSCacheEntry
 from .base_ha_storage import BaseHAStorageAdapter
@@ -101,10 +103,6 @@ class HALhsStorage(BaseHAStorageAdapter[dict[str, Any]], ILhsStorage):
 
         await self._ensure_loaded()
 
-        from typing import cast
-
-        from ...domain.constants import MINIMUM_REALISTIC_LHS
-
         # Try to get the cached global LHS (set by update_global_lhs_from_cycles)
         cached_entry_data = self._data.get("cached_global_lhs")
         if cached_entry_data and isinstance(cached_entry_data, dict):
@@ -165,7 +163,8 @@ class HALhsStorage(BaseHAStorageAdapter[dict[str, Any]], ILhsStorage):
 
         await self._ensure_loaded()
         self._data["cached_global_lhs"] = self._serialize_lhs_cache_entry(lhs, updated_at)
-        await self._save_data()
+        # Written right before the per-hour contextual values; share their delayed save
+        self._schedule_save()
 
     async def get_cached_contextual_lhs(self, hour: int) -> LHSCacheEntry | None:
         """Return cached contextual LHS for the given hour if available."""
@@ -191,7 +190,8 @@ class HALhsStorage(BaseHAStorageAdapter[dict[str, Any]], ILhsStorage):
         await self._ensure_loaded()
         contextual_cache = self._data.setdefault("cached_contextual_lhs", {})
         contextual_cache[str(hour)] = self._serialize_lhs_cache_entry(lhs, updated_at)
-        await self._save_data()
+        # Contextual values are refreshed per hour in bursts; coalesce the writes
+        self._schedule_save()
 
     async def clear_contextual_cache(self) -> None:
         """Clear all cached contextual LHS entries."""
@@ -206,8 +206,6 @@ class HALhsStorage(BaseHAStorageAdapter[dict[str, Any]], ILhsStorage):
         Returns:
             Dead time in minutes, or None if not yet learned
         """
-        from typing import cast
-
         await self._ensure_loaded()
         dead_time_entry = self._data.get("learned_dead_time")
         if dead_time_entry and isinstance(dead_time_entry, dict):
@@ -226,19 +224,9 @@ class HALhsStorage(BaseHAStorageAdapter[dict[str, Any]], ILhsStorage):
         if dead_time is None:
             self._data["learned_dead_time"] = None
         else:
-            updated_at = datetime.now() if not hasattr(self, "_get_now") else self._get_now()
-            try:
-                from homeassistant.util import dt as dt_util
-
-                if dt_util is not None:
-                    updated_at = dt_util.now()
-            except ImportError:
-                pass
             self._data["learned_dead_time"] = {
                 "value": dead_time,
-                "updated_at": updated_at.isoformat()
-                if isinstance(updated_at, datetime)
-                else str(updated_at),
+                "updated_at": dt_util.now().isoformat(),
             }
         await self._save_data()
         _LOGGER.info("Learned dead time updated: %.1f minutes", dead_time or 0)
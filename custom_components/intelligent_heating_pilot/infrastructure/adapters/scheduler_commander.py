@@ -10,6 +10,7 @@ import logging
 from datetime import datetime
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 
 from ...domain.interfaces.scheduler_commander_interface import ISchedulerCommander
 from .utils import get_entity_name
@@ -105,8 +106,6 @@ class HASchedulerCommander(ISchedulerCommander):
             raise ValueError("Scheduler entity ID not configured")
 
         # Get current time
-        from homeassistant.util import dt as dt_util
-
         now = dt_util.now()
         current_time_str = now.strftime("%H:%M")
 
@@ -23,6 +23,9 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound for memoized next_trigger parses; trigger strings change a few times a day
+_TRIGGER_CACHE_MAX_SIZE = 32
+
 
 class HASchedulerReader(ISchedulerReader):
     """Home Assistant implementation of scheduler reader.
@@ -52,6 +55,9 @@ class HASchedulerReader(ISchedulerReader):
         self._hass = hass
         self._scheduler_entity_ids = scheduler_entity_ids
         self._vtherm_entity_id = vtherm_entity_id
+        # Parsed next_trigger values keyed by raw string (the same trigger is re-read
+        # on every update until the scheduler moves to its next slot)
+        self._parsed_triggers: dict[str, datetime | None] = {}
 
     async def get_next_timeslot(self) -> ScheduledTimeslot | None:
         """Retrieve the next scheduled heating timeslot.
@@ -175,15 +181,34 @@ class HASchedulerReader(ISchedulerReader):
         if not next_trigger_raw:
             return None
 
+        raw = str(next_trigger_raw)
+        if raw in self._parsed_triggers:
+            return self._parsed_triggers[raw]
+
+        result = self._parse_trigger_string(raw)
+        if len(self._parsed_triggers) >= _TRIGGER_CACHE_MAX_SIZE:
+            self._parsed_triggers.clear()
+        self._parsed_triggers[raw] = result
+        return result
+
+    def _parse_trigger_string(self, raw: str) -> datetime | None:
+        """Parse a non-empty trigger string to a timezone-aware datetime.
+
+        Args:
+            raw: Trigger time as a string
+
+        Returns:
+            Parsed datetime with timezone, or None if parsing fails
+        """
         # Try HA's robust datetime parser first
-        parsed = dt_util.parse_datetime(str(next_trigger_raw))
+        parsed = dt_util.parse_datetime(raw)
 
         # Fallback to ISO format parsing
         if parsed is None:
             try:
-                parsed = datetime.fromisoformat(str(next_trigger_raw))
+                parsed = datetime.fromisoformat(raw)
             except ValueError:
-                _LOGGER.debug("Failed to parse next_trigger: %s", next_trigger_raw)
+                _LOGGER.debug("Failed to parse next_trigger: %s", raw)
                 return None
 
         # Ensure timezone is set
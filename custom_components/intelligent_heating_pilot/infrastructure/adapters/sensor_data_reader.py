@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from ...domain.interfaces.historical_data_adapter_interface import IHistoricalDataAdapter
@@ -15,6 +16,7 @@ from ...domain.value_objects import (
     HistoricalDataSet,
     HistoricalMeasurement,
 )
+from .utils import NON_NUMERIC_STATES, safe_float
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -101,7 +103,7 @@ class HASensorDataReader(IHistoricalDataAdapter):
             entity_id_from_record = record.get("entity_id", entity_id)
 
             # Try to convert state to numeric value - skip if not convertible
-            numeric_value = self._safe_float(state)
+            numeric_value = safe_float(state)
             if numeric_value is None:
                 _LOGGER.debug(
                     "Skipping non-numeric sensor state '%s' for %s at %s",
@@ -162,21 +164,6 @@ class HASensorDataReader(IHistoricalDataAdapter):
         # Fallback: return current time if no timestamp found
         return datetime.now()
 
-    @staticmethod
-    def _safe_float(value: Any) -> float | None:
-        """Safely convert value to float.
-
-        Args:
-            value: Value to convert
-
-        Returns:
-            Float value or None if conversion fails
-        """
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return None
-
     async def _fetch_history(
         self,
         entity_id: str,
@@ -197,8 +184,6 @@ class HASensorDataReader(IHistoricalDataAdapter):
         Returns:
             List of historical records from Home Assistant
         """
-        from functools import partial
-
         from homeassistant.components.recorder import get_instance, history
 
         # Use Home Assistant's get_significant_states function from recorder
@@ -223,19 +208,23 @@ class HASensorDataReader(IHistoricalDataAdapter):
 
         # Convert State objects to lightweight dicts (OOM prevention).
         # Sensors typically only have a state value, minimal attributes needed.
+        # Unknown/unavailable states skip the attribute copy, since
+        # fetch_historical_data discards them anyway (and logs each skip).
         result = []
         for state in state_list:
             if isinstance(state, dict):
                 result.append(state)
-            else:
-                result.append(
-                    {
-                        "entity_id": state.entity_id,
-                        "state": state.state,
-                        "attributes": dict(state.attributes),
-                        "last_changed": state.last_changed,
-                        "last_updated": state.last_updated,
-                    }
-                )
+                continue
+            result.append(
+                {
+                    "entity_id": state.entity_id,
+                    "state": state.state,
+                    "attributes": (
+                        {} if state.state in NON_NUMERIC_STATES else dict(state.attributes)
+                    ),
+                    "last_changed": state.last_changed,
+                    "last_updated": state.last_updated,
+                }
+            )
         del state_list
         return result
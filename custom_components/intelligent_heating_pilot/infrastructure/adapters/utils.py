@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from typing import cast
+from typing import TYPE_CHECKING, Any, cast
 
-from homeassistant.core import HomeAssistant
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+# Entity states that never convert to float ("unknown"/"unavailable" in Home Assistant)
+NON_NUMERIC_STATES: frozenset[str] = frozenset({"unknown", "unavailable", ""})
 
 
 def get_entity_name(hass: HomeAssistant, entity_id: str) -> str:
@@ -21,3 +25,25 @@ def get_entity_name(hass: HomeAssistant, entity_id: str) -> str:
     if state:
         return cast(str, state.attributes.get("friendly_name", entity_id))
     return entity_id
+
+
+def safe_float(value: Any) -> float | None:
+    """Safely convert a state or attribute value to float.
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        Float value or None if conversion fails
+    """
+    if value is None:
+        return None
+    if type(value) is float:
+        return value
+    # Skip the exception path for the usual non-numeric recorder states
+    if isinstance(value, str) and value in NON_NUMERIC_STATES:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
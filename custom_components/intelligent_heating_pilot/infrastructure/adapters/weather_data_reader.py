@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from ...domain.interfaces.historical_data_adapter_interface import IHistoricalDataAdapter
@@ -15,6 +16,7 @@ from ...domain.value_objects import (
     HistoricalDataSet,
     HistoricalMeasurement,
 )
+from .utils import safe_float
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -23,6 +25,13 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Weather entity attribute holding the value of each supported data key
+_DATA_KEY_TO_ATTRIBUTE: dict[HistoricalDataKey, str] = {
+    HistoricalDataKey.OUTDOOR_TEMP: "temperature",
+    HistoricalDataKey.OUTDOOR_HUMIDITY: "humidity",
+    HistoricalDataKey.CLOUD_COVERAGE: "cloud_coverage",
+}
+
 
 class HAWeatherDataReader(IHistoricalDataAdapter):
     """Adapter for reading historical weather data from Home Assistant.
@@ -75,6 +84,15 @@ class HAWeatherDataReader(IHistoricalDataAdapter):
             end_time,
         )
 
+        attribute_name = _DATA_KEY_TO_ATTRIBUTE.get(data_key)
+        if attribute_name is None:
+            _LOGGER.warning(
+                "Weather adapter does not support data_key %s for entity %s",
+                data_key,
+                entity_id,
+            )
+            return HistoricalDataSet(data={})
+
         try:
             # Get historical data from Home Assistant
             historical_records = await self._fetch_history(
@@ -98,41 +116,16 @@ class HAWeatherDataReader(IHistoricalDataAdapter):
             attributes = record.get("attributes", {})
             entity_id_from_record = record.get("entity_id", entity_id)
 
-            # Create attributes dict with weather state
-            enriched_attributes = {**attributes, "weather_state": state}
-
-            # Extract data based on requested data_key
-            value = None
-            if data_key == HistoricalDataKey.OUTDOOR_TEMP:
-                # Extract outdoor temperature
-                if "temperature" in attributes:
-                    value = self._safe_float(attributes["temperature"])
-
-            elif data_key == HistoricalDataKey.OUTDOOR_HUMIDITY:
-                # Extract outdoor humidity
-                if "humidity" in attributes:
-                    value = self._safe_float(attributes["humidity"])
-
-            elif data_key == HistoricalDataKey.CLOUD_COVERAGE:
-                # Extract cloud coverage
-                if "cloud_coverage" in attributes:
-                    value = self._safe_float(attributes["cloud_coverage"])
-
-            else:
-                _LOGGER.warning(
-                    "Weather adapter does not support data_key %s for entity %s",
-                    data_key,
-                    entity_id,
-                )
-                continue
+            # Extract the attribute mapped to the requested data_key
+            value = safe_float(attributes.get(attribute_name))
 
-            # Add measurement if value was extracted
+            # Add measurement if value was extracted, with the weather state attached
             if value is not None:
                 measurements.append(
                     HistoricalMeasurement(
                         timestamp=timestamp,
                         value=value,
-                        attributes=enriched_attributes,
+                        attributes={**attributes, "weather_state": state},
                         entity_id=entity_id_from_record,
                     )
                 )
@@ -179,21 +172,6 @@ class HAWeatherDataReader(IHistoricalDataAdapter):
         # Fallback: return current time if no timestamp found
         return datetime.now()
 
-    @staticmethod
-    def _safe_float(value: Any) -> float | None:
-        """Safely convert value to float.
-
-        Args:
-            value: Value to convert
-
-        Returns:
-            Float value or None if conversion fails
-        """
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return None
-
     async def _fetch_history(
         self,
         entity_id: str,
@@ -214,8 +192,6 @@ class HAWeatherDataReader(IHistoricalDataAdapter):
         Returns:
             List of historical records from Home Assistant
         """
-        from functools import partial
-
         from homeassistant.components.recorder import get_instance, history
 
         # Use Home Assistant's get_significant_states function from recorder
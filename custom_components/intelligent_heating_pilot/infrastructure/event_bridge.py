@@ -9,6 +9,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections.abc import Callable
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
@@ -400,8 +401,6 @@ class HAEventBridge:
         Args:
             seconds: How long to ignore changes
         """
-        from datetime import timedelta
-
         self._ignore_vtherm_until = dt_util.now() + timedelta(seconds=seconds)
 
     async def async_cleanup(self) -> None:
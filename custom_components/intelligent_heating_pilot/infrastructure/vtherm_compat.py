@@ -48,29 +48,23 @@ def get_vtherm_attribute(
         >>> get_vtherm_attribute(state, "temperature_slope")
         0.04
     """
-    if not state or not state.attributes:
+    if not state:
+        return default
+    attributes = state.attributes
+    if not attributes:
         return default
 
-    # Try new nested path first (v8.0.0+)
-    specific_states = state.attributes.get("specific_states")
+    # Try new nested path first (v8.0.0+). Hits return without logging: this
+    # runs on every VTherm state change.
+    specific_states = attributes.get("specific_states")
     if specific_states and isinstance(specific_states, dict):
         value = specific_states.get(attribute_name)
         if value is not None:
-            _LOGGER.debug(
-                "Found %s in specific_states (v8.0.0+ format): %s",
-                attribute_name,
-                value,
-            )
             return value
 
     # Fallback to legacy root path (pre-v8.0.0)
-    value = state.attributes.get(attribute_name)
+    value = attributes.get(attribute_name)
     if value is not None:
-        _LOGGER.debug(
-            "Found %s at root level (legacy format): %s",
-            attribute_name,
-            value,
-        )
         return value
 
     _LOGGER.debug(
@@ -561,6 +561,7 @@ class TestHeatingCycleLifecycleManager:
         manager: HeatingCycleLifecycleManager,
         mock_heating_cycle_service: Mock,
         mock_heating_cycle_storage: Mock,
+        mock_historical_adapter: Mock,
         base_datetime: datetime,
     ) -> None:
         """Test update_cycles_for_window method.
@@ -596,6 +597,9 @@ class TestHeatingCycleLifecycleManager:
         # THEN Aspect A: Extracts and returns cycles
         mock_heating_cycle_service.extract_heating_cycles.assert_called_once()
         assert result == expected_cycles
+        # History is fetched with a single recorder query per adapter
+        mock_historical_adapter.fetch_all_historical_data.assert_awaited_once()
+        mock_historical_adapter.fetch_historical_data.assert_not_called()
 
         # WHEN: update_cycles_for_window is called with cache (separate call)
         new_cycles = [self._create_heating_cycle(base_datetime - timedelta(days=3))]
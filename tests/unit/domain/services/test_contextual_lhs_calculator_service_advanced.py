@@ -516,3 +516,37 @@ class TestContextualLHSCalculatorServiceAdvanced:
 
         # All 24 hours should have data
         assert all(result[h] is not None for h in range(24))
+
+    def test_calculate_all_matches_per_hour_calculation(
+        self, service: ContextualLHSCalculatorService, base_datetime: datetime
+    ) -> None:
+        """Test that the single-pass bulk calculation matches the per-hour one."""
+        cycles = [
+            self._create_cycle(
+                start_time=base_datetime + timedelta(days=i // 24, hours=(i * 7) % 24),
+                start_temp=18.0,
+                end_temp=18.0 + (i % 5) - 1,  # includes zero and negative slopes
+            )
+            for i in range(120)
+        ]
+
+        result = service.calculate_all_contextual_lhs(cycles)
+
+        for hour in range(24):
+            assert result[hour] == service.calculate_contextual_lhs_for_hour(cycles, hour)
+
+    def test_calculate_all_logs_empty_hours_like_per_hour_calculation(
+        self, service: ContextualLHSCalculatorService, base_datetime: datetime, caplog
+    ) -> None:
+        """Test that both paths log why an hour without cycles has no LHS."""
+        cycles = [self._create_cycle(start_time=base_datetime.replace(hour=6))]
+
+        with caplog.at_level("DEBUG"):
+            service.calculate_all_contextual_lhs(cycles)
+        assert "No cycles found for hour 7" in caplog.text
+        assert "No cycles found for hour 6" not in caplog.text
+
+        caplog.clear()
+        with caplog.at_level("DEBUG"):
+            service.calculate_contextual_lhs_for_hour(cycles, 7)
+        assert "No cycles found for hour 7" in caplog.text
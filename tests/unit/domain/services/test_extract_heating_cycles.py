@@ -365,6 +365,33 @@ class TestExtractEdgeCases:
         assert cycles[0].start_time == t1
         assert cycles[0].end_time == end_time  # Uses dataset end_time
 
+    @pytest.mark.asyncio
+    async def test_unfinished_cycle_keeps_zero_degree_temperatures(self, service, base_time):
+        """Given a 0.0 °C indoor reading, keeps it instead of the 20.0 °C placeholder."""
+        t0 = base_time
+        t1 = t0 + timedelta(minutes=10)
+        t2 = t0 + timedelta(minutes=20)  # End of data (still heating)
+
+        dataset = HistoricalDataSet(
+            data={
+                HistoricalDataKey.INDOOR_TEMP: [m(t, 0.0) for t in [t0, t1, t2]],
+                HistoricalDataKey.TARGET_TEMP: [m(t, 7.0) for t in [t0, t1, t2]],
+                HistoricalDataKey.HEATING_STATE: [
+                    m(t0, False, hvac_action="off", hvac_mode="off"),
+                    m(t1, True, hvac_action="heating", hvac_mode="heat"),  # START
+                    m(t2, True, hvac_action="heating", hvac_mode="heat"),  # Still active at end
+                ],
+            }
+        )
+
+        end_time = t2 + timedelta(minutes=5)
+        cycles = await service.extract_heating_cycles("my_device_id", dataset, t0, end_time)
+
+        assert len(cycles) == 1
+        assert cycles[0].start_temp == 0.0
+        assert cycles[0].end_temp == 0.0
+        assert cycles[0].target_temp == 7.0
+
     @pytest.mark.asyncio
     async def test_too_short_cycle_rejected(self, service, base_time):
         """Given cycle shorter than min_cycle_duration, rejects it."""
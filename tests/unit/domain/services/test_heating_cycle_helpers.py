@@ -401,6 +401,43 @@ class TestGetTemperaturesAt:
         assert target is None
 
 
+class TestSortedHistoryLookup:
+    """Tests for _build_sorted_history and _lookup_float_at helpers."""
+
+    def test_lookup_returns_latest_value_at_or_before_time(self, service, base_time):
+        """Given unsorted history, lookup returns the latest value at or before the time."""
+        history = [
+            m(base_time + timedelta(minutes=10), 20.0),
+            m(base_time, 19.0),
+            m(base_time + timedelta(minutes=5), "unavailable"),
+        ]
+
+        timestamps, values = service._build_sorted_history(history)
+
+        def lookup(minutes: int) -> float | None:
+            return service._lookup_float_at(
+                timestamps, values, base_time + timedelta(minutes=minutes)
+            )
+
+        assert values == [19.0, None, 20.0]
+        assert lookup(-1) is None
+        assert lookup(4) == 19.0
+        assert lookup(7) is None
+        assert lookup(60) == 20.0
+
+    def test_sweep_matches_per_time_lookup(self, service, base_time):
+        """Given sorted query times, the merge sweep agrees with bisect lookups."""
+        timestamps, values = service._build_sorted_history(
+            [m(base_time + timedelta(minutes=minute), 18.0 + minute) for minute in (0, 5, 5, 12)]
+        )
+        query_times = [base_time + timedelta(minutes=minute) for minute in (-3, 0, 4, 5, 11, 30)]
+
+        swept = service._sweep_floats_at(query_times, timestamps, values)
+
+        assert swept == [service._lookup_float_at(timestamps, values, t) for t in query_times]
+        assert swept == [None, 18.0, 18.0, 23.0, 23.0, 30.0]
+
+
 class TestShouldStartCycle:
     """Tests for _should_start_cycle helper."""
 
@@ -193,3 +193,24 @@ class TestHeatingCycleAvgHeatingSlope:
         )
 
         assert cycle.avg_heating_slope == 0.0
+
+
+class TestHeatingCycleSlots:
+    """HeatingCycle is slotted: no per-instance __dict__, still immutable."""
+
+    def test_heating_cycle_uses_slots(self) -> None:
+        """A slotted cycle carries no __dict__ and rejects new attributes."""
+        cycle = make_cycle(total_duration_minutes=30.0, dead_time_minutes=None)
+
+        assert not hasattr(cycle, "__dict__")
+        with pytest.raises((AttributeError, TypeError)):
+            cycle.extra = 1  # type: ignore[attr-defined]
+
+    def test_avg_heating_slope_not_part_of_equality(self) -> None:
+        """The precomputed slope is derived state: it is excluded from eq and repr."""
+        cycle = make_cycle(total_duration_minutes=60.0, dead_time_minutes=None)
+        same_cycle = make_cycle(total_duration_minutes=60.0, dead_time_minutes=None)
+
+        assert cycle == same_cycle
+        assert cycle.avg_heating_slope == pytest.approx(2.0)
+        assert "_avg_heating_slope" not in repr(cycle)
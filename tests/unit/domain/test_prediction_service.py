@@ -262,6 +262,22 @@ class TestPredictionService(unittest.TestCase):
             duration_diff >= dead_time_minutes - 1.0
         ), f"Dead time effect ({duration_diff}) should be ~{dead_time_minutes}"
 
+    def test_confidence_boost_per_available_sensor(self):
+        """Each available environmental sensor adds a fixed confidence boost."""
+        # (slope, base confidence, one sensor, both sensors)
+        cases = [
+            (0.3, 0.6, 0.65, 0.7),  # low slope
+            (1.0, 0.75, 0.8, 0.85),  # medium slope
+            (2.0, 0.9, 0.95, 1.0),  # high slope
+        ]
+        for slope, base, one, both in cases:
+            with self.subTest(slope=slope):
+                calculate = self.service._calculate_confidence
+                self.assertAlmostEqual(calculate(slope, None, None), base)
+                self.assertAlmostEqual(calculate(slope, TEST_OUTDOOR_TEMP, None), one)
+                self.assertAlmostEqual(calculate(slope, None, TEST_HUMIDITY), one)
+                self.assertAlmostEqual(calculate(slope, TEST_OUTDOOR_TEMP, TEST_HUMIDITY), both)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -70,3 +70,12 @@ def test_slope_data_inequality_different_value() -> None:
     slope_data2 = SlopeData(slope_value=3.0, timestamp=timestamp)
 
     assert slope_data1 != slope_data2
+
+
+def test_slope_data_uses_slots() -> None:
+    """Test that SlopeData instances carry no per-instance __dict__."""
+    slope_data = SlopeData(slope_value=2.5, timestamp=datetime.now(timezone.utc))
+
+    assert not hasattr(slope_data, "__dict__")
+    with pytest.raises((AttributeError, TypeError)):
+        slope_data.extra = 1  # type: ignore[attr-defined]
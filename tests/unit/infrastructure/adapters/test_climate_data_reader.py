@@ -353,6 +353,24 @@ class TestFetchHistoricalData:
         rdr = HAClimateDataReader(mock_hass, recorder_queue, TEST_ENTITY_ID)
         assert rdr._recorder_queue is recorder_queue
 
+    @pytest.mark.asyncio
+    async def test_fetch_all_matches_per_key_fetches(self, reader: HAClimateDataReader) -> None:
+        """Fetching all keys at once yields the same values as one fetch per key."""
+        start_time = get_test_datetime()
+        end_time = get_future_datetime(hours=1)
+        reader._fetch_history = AsyncMock(return_value=MOCK_CLIMATE_HISTORY_RESPONSE[0])
+
+        combined = await reader.fetch_all_historical_data(TEST_ENTITY_ID, start_time, end_time)
+
+        reader._fetch_history.assert_awaited_once()
+        for data_key in HistoricalDataKey:
+            single = await reader.fetch_historical_data(
+                TEST_ENTITY_ID, data_key, start_time, end_time
+            )
+            assert [(m.timestamp, m.value) for m in combined.data.get(data_key, [])] == [
+                (m.timestamp, m.value) for m in single.data.get(data_key, [])
+            ]
+
 
 # ===========================================================================
 # Timestamp parsing tests
@@ -393,19 +411,3 @@ def test_parse_timestamp_falls_back_to_now() -> None:
         _FakeDatetime,
     ):
         assert HAClimateDataReader._parse_timestamp({}) == fixed_now
-
-
-# ===========================================================================
-# Float conversion safety tests
-# ===========================================================================
-
-
-def test_safe_float_returns_float() -> None:
-    """Convert valid values to float."""
-    assert HAClimateDataReader._safe_float("12.5") == 12.5
-
-
-def test_safe_float_returns_none_on_invalid() -> None:
-    """Return None for invalid float values."""
-    assert HAClimateDataReader._safe_float("bad") is None
-    assert HAClimateDataReader._safe_float(None) is None
@@ -0,0 +1,32 @@
+"""Tests for the entity attribute mappers."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+from custom_components.intelligent_heating_pilot.domain.value_objects.entity_attribute_mapping import (
+    AttributeConcept,
+)
+from custom_components.intelligent_heating_pilot.infrastructure.adapters.generic_climate_attribute_mapper import (
+    GenericClimateAttributeMapper,
+)
+
+
+def test_mapping_is_built_once_across_extractions() -> None:
+    """The static attribute mapping is built on first use and then reused."""
+    mapper = GenericClimateAttributeMapper(Mock())
+    attributes = {"current_temperature": 19.5, "temperature": 21.0}
+
+    with patch.object(
+        GenericClimateAttributeMapper,
+        "_get_mapping",
+        autospec=True,
+        side_effect=GenericClimateAttributeMapper._get_mapping,
+    ) as get_mapping:
+        for concept in (AttributeConcept.CURRENT_TEMPERATURE, AttributeConcept.TARGET_TEMPERATURE):
+            mapper.extract_attribute_value(attributes, concept)
+        current = mapper.extract_attribute_value(attributes, AttributeConcept.CURRENT_TEMPERATURE)
+        mapper.get_supported_concepts()
+
+    assert current == 19.5
+    assert get_mapping.call_count == 1
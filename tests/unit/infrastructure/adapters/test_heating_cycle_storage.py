@@ -317,6 +317,54 @@ async def test_append_cycles_to_existing_cache(
     assert cache._data[device_id]["last_search_time"] == search_end.isoformat()
 
 
+@pytest.mark.asyncio
+async def test_append_cycles_reuses_stored_cycle_dicts(
+    cache: HAHeatingCycleStorage,
+    device_id: str,
+    base_time: datetime,
+) -> None:
+    """Test that existing cycles are not re-serialized on append."""
+    initial_cycles = [create_test_heating_cycle(device_id, base_time + timedelta(hours=2))]
+    await cache.append_cycles(device_id, initial_cycles, base_time + timedelta(hours=3))
+    stored_dict = cache._data[device_id]["cycles"][0]
+
+    # Earlier cycle appended afterwards must still be sorted first
+    await cache.append_cycles(
+        device_id, [create_test_heating_cycle(device_id, base_time)], base_time + timedelta(hours=4)
+    )
+
+    cycles = cache._data[device_id]["cycles"]
+    assert len(cycles) == 2
+    assert cycles[0]["start_time"] == base_time.isoformat()
+    assert cycles[1] is stored_dict
+
+
+@pytest.mark.asyncio
+async def test_get_cache_data_reused_until_next_write(
+    cache: HAHeatingCycleStorage,
+    device_id: str,
+    base_time: datetime,
+) -> None:
+    """Test that cache data is deserialized once and refreshed after a write."""
+    await cache.append_cycles(
+        device_id, [create_test_heating_cycle(device_id, base_time)], base_time + timedelta(hours=1)
+    )
+
+    first = await cache.get_cache_data(device_id)
+    assert await cache.get_cache_data(device_id) is first
+
+    await cache.append_cycles(
+        device_id,
+        [create_test_heating_cycle(device_id, base_time + timedelta(hours=2))],
+        base_time + timedelta(hours=3),
+    )
+
+    refreshed = await cache.get_cache_data(device_id)
+    assert refreshed is not first
+    assert refreshed is not None
+    assert refreshed.cycle_count == 2
+
+
 @pytest.mark.asyncio
 async def test_append_cycles_deduplication(
     cache: HAHeatingCycleStorage,
@@ -379,8 +427,9 @@ async def test_prune_old_cycles(
     # Prune old cycles
     await cache.prune_old_cycles(device_id, base_time)
 
-    # Should have removed 1 cycle (35 days old)
-    mock_store.async_save.assert_called_once()
+    # Should have removed 1 cycle (35 days old) and deferred the write
+    mock_store.async_save.assert_not_called()
+    mock_store.async_delay_save.assert_called_once()
     assert len(cache._data[device_id]["cycles"]) == 3
 
 
@@ -396,6 +445,7 @@ async def test_prune_old_cycles_no_cache(
 
     # Should not save anything
     mock_store.async_save.assert_not_called()
+    mock_store.async_delay_save.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -420,6 +470,7 @@ async def test_prune_old_cycles_nothing_to_prune(
 
     # Should not save (nothing changed)
     mock_store.async_save.assert_not_called()
+    mock_store.async_delay_save.assert_not_called()
 
 
 @pytest.mark.asyncio
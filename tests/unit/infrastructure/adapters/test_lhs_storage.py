@@ -288,8 +288,8 @@ async def test_set_and_get_cached_global_lhs(storage: HALhsStorage, mock_store:
     # Set cache
     await storage.set_cached_global_lhs(lhs_value, now)
 
-    # Verify it was saved
-    mock_store.async_save.assert_called()
+    # Verify a save was scheduled
+    mock_store.async_delay_save.assert_called()
 
     # Get cache
     cached = await storage.get_cached_global_lhs()
@@ -316,8 +316,8 @@ async def test_set_and_get_cached_contextual_lhs(storage: HALhsStorage, mock_sto
     # Set cache
     await storage.set_cached_contextual_lhs(hour, lhs_value, now)
 
-    # Verify it was saved
-    mock_store.async_save.assert_called()
+    # Verify a save was scheduled
+    mock_store.async_delay_save.assert_called()
 
     # Get cache
     cached = await storage.get_cached_contextual_lhs(hour)
@@ -327,6 +327,38 @@ async def test_set_and_get_cached_contextual_lhs(storage: HALhsStorage, mock_sto
     assert abs((cached.updated_at - now).total_seconds()) < 1
 
 
+@pytest.mark.asyncio
+async def test_set_cached_contextual_lhs_coalesces_saves(
+    storage: HALhsStorage, mock_store: Mock
+) -> None:
+    """Test that a burst of contextual updates schedules delayed saves only."""
+    for hour in range(24):
+        await storage.set_cached_contextual_lhs(hour, 2.0 + hour / 10, datetime.now())
+
+    mock_store.async_save.assert_not_called()
+    assert mock_store.async_delay_save.call_count == 24
+    data_func, delay = mock_store.async_delay_save.call_args.args
+    assert delay > 0
+    assert len(data_func()["cached_contextual_lhs"]) == 24
+
+
+@pytest.mark.asyncio
+async def test_lhs_refresh_coalesces_into_single_delayed_save(
+    storage: HALhsStorage, mock_store: Mock
+) -> None:
+    """Test that a global + contextual refresh only schedules delayed saves."""
+    now = datetime.now(timezone.utc)
+    await storage.set_cached_global_lhs(2.4, now)
+    for hour in (6, 7, 8):
+        await storage.set_cached_contextual_lhs(hour, 2.5, now)
+
+    mock_store.async_save.assert_not_called()
+    data_func, _ = mock_store.async_delay_save.call_args.args
+    data = data_func()
+    assert data["cached_global_lhs"]["value"] == 2.4
+    assert set(data["cached_contextual_lhs"]) == {"6", "7", "8"}
+
+
 @pytest.mark.asyncio
 async def test_clear_contextual_cache(storage: HALhsStorage, mock_store: Mock) -> None:
     """Test clearing contextual LHS cache."""
@@ -1,7 +1,7 @@
 """Tests for HASchedulerReader adapter."""
 
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -283,6 +283,18 @@ def test_parse_next_trigger_invalid(reader: HASchedulerReader) -> None:
     assert result is None
 
 
+def test_parse_next_trigger_reuses_parsed_value(reader: HASchedulerReader) -> None:
+    """Test that a repeated trigger string is parsed only once."""
+    trigger_str = "2024-01-15T07:30:00+01:00"
+
+    first = reader._parse_next_trigger(trigger_str)
+    with patch.object(reader, "_parse_trigger_string") as parse_mock:
+        second = reader._parse_next_trigger(trigger_str)
+
+    parse_mock.assert_not_called()
+    assert second == first
+
+
 def test_resolve_preset_temperature_v8_format(mock_hass: Mock) -> None:
     """Test resolving preset temperature from VTherm v8.0.0+ format."""
     # Setup VTherm entity with v8.0.0+ preset_temperatures structure
@@ -6,6 +6,7 @@ from unittest.mock import Mock
 
 from custom_components.intelligent_heating_pilot.infrastructure.adapters.utils import (
     get_entity_name,
+    safe_float,
 )
 
 
@@ -35,3 +36,22 @@ def test_get_entity_name_falls_back_to_entity_id_when_no_friendly_name() -> None
     mock_hass.states.get.return_value = state
 
     assert get_entity_name(mock_hass, "climate.vtherm") == "climate.vtherm"
+
+
+def test_safe_float_returns_float() -> None:
+    """Convert valid values to float."""
+    assert safe_float("12.5") == 12.5
+
+
+def test_safe_float_returns_none_on_invalid() -> None:
+    """Return None for invalid float values."""
+    assert safe_float("bad") is None
+    assert safe_float(None) is None
+
+
+def test_safe_float_fast_paths() -> None:
+    """Return floats unchanged and None for unavailable states without parsing."""
+    assert safe_float(19.5) == 19.5
+    assert safe_float(20) == 20.0
+    assert safe_float("unavailable") is None
+    assert safe_float("unknown") is None
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import logging
+import sys
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from custom_components.intelligent_heating_pilot.domain.value_objects import HistoricalDataKey
 from custom_components.intelligent_heating_pilot.infrastructure.adapters.climate_data_reader import (
     HAClimateDataReader,
 )
@@ -61,3 +66,57 @@ class TestAdaptersWithRecorderQueue:
         assert sensor._recorder_queue is climate._recorder_queue
         assert climate._recorder_queue is weather._recorder_queue
         assert sensor._recorder_queue.lock is recorder_queue.lock
+
+    @pytest.mark.asyncio
+    async def test_weather_reader_skips_recorder_for_unsupported_key(
+        self, mock_hass, recorder_queue
+    ):
+        """Weather reader does not query the recorder for keys it cannot extract."""
+        reader = HAWeatherDataReader(mock_hass, recorder_queue)
+        reader._fetch_history = AsyncMock(return_value=[])
+        end_time = datetime(2024, 1, 2)
+
+        result = await reader.fetch_historical_data(
+            "weather.home", HistoricalDataKey.INDOOR_TEMP, end_time - timedelta(days=1), end_time
+        )
+
+        assert result.data == {}
+        reader._fetch_history.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_sensor_reader_all_unavailable_history_logs_no_warning(
+        self, mock_hass, recorder_queue, caplog
+    ):
+        """A sensor unavailable for the whole window yields no data and no warning."""
+        end_time = datetime(2024, 1, 2)
+        states = [
+            SimpleNamespace(
+                entity_id="sensor.outdoor",
+                state="unavailable",
+                attributes={"friendly_name": "Outdoor"},
+                last_changed=end_time - timedelta(hours=hours),
+                last_updated=end_time - timedelta(hours=hours),
+            )
+            for hours in (3, 2, 1)
+        ]
+        recorder = MagicMock()
+        recorder.history.get_significant_states = MagicMock(return_value={"sensor.outdoor": states})
+        recorder.get_instance.return_value.async_add_executor_job = AsyncMock(
+            side_effect=lambda func: func()
+        )
+        reader = HASensorDataReader(mock_hass, recorder_queue)
+
+        with (
+            patch.dict(sys.modules, {"homeassistant.components.recorder": recorder}),
+            caplog.at_level(logging.DEBUG),
+        ):
+            result = await reader.fetch_historical_data(
+                "sensor.outdoor",
+                HistoricalDataKey.OUTDOOR_TEMP,
+                end_time - timedelta(days=1),
+                end_time,
+            )
+
+        assert result.data == {}
+        assert not [r for r in caplog.records if r.levelno >= logging.WARNING]
+        assert caplog.text.count("Skipping non-numeric sensor state 'unavailable'") == 3